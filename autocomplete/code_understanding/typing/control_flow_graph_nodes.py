@@ -327,9 +327,12 @@ class FromImportCfgNode(CfgNode):
         module = self.module_loader.get_module_from_key(self.get_module_key())
 
         def load_all():
-          for name, pobject in filter(lambda kv: kv[0][0] != '_', module.items()):
-            curr_frame[name] = AugmentedObject(pobject, imported=True)
-          info(f'Using module.keys() instead of __all__: {list(filter(lambda k: k[0]!= "_", module.keys()))}')
+          names = []
+          for name, pobject in module.items():
+            if name[0] != '_':
+              curr_frame[name] = AugmentedObject(pobject, imported=True)
+              names.append(name)
+          info(f'Using module.keys() instead of __all__: {names}')
 
         if '__all__' in module:
           try:
@@ -762,12 +765,12 @@ class KlassCfgNode(CfgNode):
     klass_name = f'{curr_frame.namespace.name}.{self.name}' if curr_frame.namespace else self.name
     #
     klass = Klass(klass_name, self._module.name)
-    curr_frame[self.name] = klass
+    curr_frame.set_name(self.name, klass)
 
     new_frame = curr_frame.make_child(frame_type=FrameType.KLASS, namespace=klass)
     # Locals defined in this frame are actually members of our class.
     self.suite.process(new_frame)
-    klass._members.update(new_frame._locals)
+    klass.add_members(new_frame._locals)
     for name, member in klass.items():
 
       def instance_member(f):
@@ -904,10 +907,10 @@ class FuncCfgNode(CfgNode):
       bound_locals = {}
       for symbol in self.closure():
         assert symbol in curr_frame, 'Unbound local issue w/closure...'
-        bound_locals[symbol] = curr_frame[symbol]
+        bound_locals[symbol] = curr_frame.get_name(symbol)
       func = BoundFunction(func, bound_locals=bound_locals)
 
-    curr_frame[VariableExpression(self.name, None)] = func
+    curr_frame.set_name(self.name, func)
 
   def _get_new_cell_symbols(self):
     # New symbols are those that are in child closures but not in our own closure because they're
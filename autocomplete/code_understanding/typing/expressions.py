@@ -1,4 +1,5 @@
 import itertools
+import sys
 from abc import ABC, abstractmethod
 from typing import (Dict, Iterable, List, Union)
 import _ast
@@ -6,7 +7,7 @@ import _ast
 import attr
 
 from . import symbol_context
-from ...nsn_logging import (debug, info)
+from ...nsn_logging import (debug, debug_enabled, info)
 from .pobjects import (FuzzyObject, NativeObject, PObject, PObjectType, NONE_POBJECT, UnknownObject,
                        pobject_from_object)
 from .utils import assert_returns_type
@@ -274,7 +275,8 @@ class CallExpression(Expression):
 
 @attr.s(slots=True)
 class VariableExpression(Expression):
-  name = attr.ib(validator=attr.validators.instance_of(str))
+  # Interned since names are used as keys in every Frame lookup and repeat across the codebase.
+  name = attr.ib(converter=sys.intern, validator=attr.validators.instance_of(str))
   parse_node = attr.ib()
 
   def evaluate(self, curr_frame) -> PObject:
@@ -438,7 +440,7 @@ class DictExpression(Expression):
 @attr.s(slots=True)
 class AttributeExpression(Expression):
   base_expression: Expression = attr.ib()
-  attribute: str = attr.ib()
+  attribute: str = attr.ib(converter=sys.intern)
   parse_node = attr.ib(kw_only=True)
 
   def evaluate(self, curr_frame) -> PObject:
@@ -630,7 +632,8 @@ class MathExpression(Expression):
         return l * r
     except TypeError:
       ...
-    debug(f'MathExpression failed: {l}{self.operator}{r}')
+    if debug_enabled():
+      debug(f'MathExpression failed: {l}{self.operator}{r}')
     return UnknownObject(f'{self.parse_node.get_code()}')
 
   # @instance_memoize
@@ -2,15 +2,15 @@
 
 https://tech.blog.aknin.name/2010/07/22/pythons-innards-interpreter-stacks/'''
 from enum import Enum
-from functools import wraps
 from typing import Dict, List
 
 import attr
 
 from . import collector, utils
-from ...nsn_logging import debug
+from ...nsn_logging import debug, debug_enabled
 from .expressions import (AttributeExpression, Expression, SubscriptExpression, VariableExpression)
-from .pobjects import (NONE_POBJECT, FuzzyObject, NativeObject, PObject, UnknownObject, pobject_from_object)
+from .pobjects import (NONE_POBJECT, AugmentedObject, FuzzyObject, LazyObject, NativeObject, PObject,
+                       UnknownObject, pobject_from_object)
 
 
 @attr.s(slots=True)
@@ -26,6 +26,27 @@ class CellObject:
   pobject: PObject = attr.ib(None)
 
 
+# Sentinel returned by Frame._resolve for names which aren't found.
+_MISSING = object()
+
+# Concrete PObject types. Checking type(value) against these avoids the comparatively slow
+# ABCMeta.__instancecheck__ of isinstance(value, PObject) for the common cases.
+_POBJECT_TYPES = frozenset((AugmentedObject, FuzzyObject, LazyObject, NativeObject, UnknownObject))
+
+
+def _new_builtins():
+  '''Builds the builtins for a root Frame.
+
+  Each root gets its own PObjects - they're mutable, so sharing them would leak attributes set on
+  a builtin (e.g. len.foo = 1) from one module into every other.'''
+  builtins = {key: UnknownObject(key) for key in utils.get_possible_builtin_symbols()}
+  # builtins['globals'] = NativeObject(lambda: return self._module.get_members())
+  # builtins['locals'] = NativeObject(lambda: return self._locals)
+  builtins['range'] = NativeObject(range)
+  # TODO: nonlocal_names and global_names
+  return builtins
+
+
 class FrameType(Enum):
   NORMAL = 1
   KLASS = 2
@@ -33,22 +54,15 @@ class FrameType(Enum):
   EXCEPT = 4
 
 
-def dereference_cell_object_returns(func):
-  @wraps(func)
-  def wrapper(self, *args, **kwargs):
-    out = func(self, *args, **kwargs)
-    if isinstance(out, CellObject):
-      if not out.pobject:
-        # NameError: free variable 'a' referenced before assignment in enclosing scope
-        # raise CellValueNotSetError()
-        return UnknownObject('CellValueNotSetError')
-      return out.pobject
-    return out
+# Accessing Enum members goes through EnumMeta.__getattr__ - so hot paths compare by identity
+# against these module-level aliases instead.
+_NORMAL_FRAME_TYPE = FrameType.NORMAL
 
-  return wrapper
+# Shared default for Frames without cell symbols - Frame._cell_symbols is never mutated in-place.
+_NO_CELL_SYMBOLS = frozenset()
 
 
-@attr.s(str=False, repr=False)
+@attr.s(str=False, repr=False, slots=True)
 class Frame:
   '''Frame vaguely mirrors the Python frame for executing code.
 
@@ -75,23 +89,31 @@ class Frame:
   _module = attr.ib()
   _locals: Dict = attr.ib(factory=dict)
   _builtins: Dict = attr.ib(None)  # TODO
-  _returns: List[PObject] = attr.ib(factory=list)
+  # Only Frames which are returned from need a list - created on the first add_return.
+  _returns: List[PObject] = attr.ib(None)
   _frame_type: FrameType = attr.ib(FrameType.NORMAL)
   namespace = attr.ib(None)
   _back: 'Frame' = attr.ib(None)
-  _cell_symbols = attr.ib(factory=set)
+  _cell_symbols = attr.ib(_NO_CELL_SYMBOLS)
+  # Snapshots are only read from (delayed actions execute in child Frames of them), so they can
+  # be shared by later snapshots rather than copied again.
+  _is_snapshot = attr.ib(False, kw_only=True)
+  # Cached from _module to avoid the attribute chain on every lookup.
+  _filename = attr.ib(init=False, default=None)
+  # The locals of this Frame and its back-stack which names are resolved against, in order. Lazily
+  # built by _get_local_scopes.
+  _local_scopes = attr.ib(init=False, default=None)
 
   # _root: 'Frame' = attr.ib(None)
 
   def __attrs_post_init__(self):
-    if not self._builtins:
-      self._builtins = {key: UnknownObject(key) for key in utils.get_possible_builtin_symbols()}
-      # self._builtins['globals'] = NativeObject(lambda: return self._module.get_members())
-      # self._builtins['locals'] = NativeObject(lambda: return self._locals)
-      self._builtins['range'] = NativeObject(range)
-      # TODO: nonlocal_names and global_names
+    if self._module is not None:
+      self._filename = self._module.filename
+    if self._builtins is None:
+      self._builtins = _new_builtins()
 
-    self.add_cell_symbols(self._cell_symbols)
+    for symbol in self._cell_symbols:
+      self[symbol] = CellObject()
 
   def add_cell_symbols(self, cell_symbols):
     self._cell_symbols = self._cell_symbols.union(cell_symbols)
@@ -99,10 +121,13 @@ class Frame:
       self[symbol] = CellObject()
 
   def contains_namespace_on_stack(self, namespace):
-    if self.namespace == namespace:
-      return True
-    if self._back:
-      return self._back.contains_namespace_on_stack(namespace)
+    # Namespaces compare by value (e.g. a nested function recreated on each call of its parent), so
+    # this can't be a set lookup - but the identity check avoids their costly __eq__ in most cases.
+    frame = self
+    while frame is not None:
+      if frame.namespace is namespace or frame.namespace == namespace:
+        return True
+      frame = frame._back
     return False
 
   def snapshot(self):
@@ -113,15 +138,18 @@ class Frame:
 
     The main issue of course is that the underlying PObjects are still mutable.
     '''
+    if self._is_snapshot:
+      return self
     return Frame(
         frame_type=self._frame_type,
         back=self._back.snapshot() if self._back else None,
         module=self._module,
         locals=self._locals.copy(),
-        returns=self._returns.copy(),
+        returns=self._returns.copy() if self._returns else None,
         namespace=self.namespace,
         builtins=self._builtins,  # Constant, no need to copy.
-        cell_symbols=self._cell_symbols.copy())
+        cell_symbols=self._cell_symbols,  # Never mutated in-place, no need to copy.
+        is_snapshot=True)
 
   def make_child(self, namespace, frame_type=FrameType.NORMAL, *, module=None, cell_symbols=None) -> 'Frame':
     # if self._frame_type == FrameType.NORMAL:
@@ -137,35 +165,50 @@ class Frame:
                  cell_symbols=cell_symbols)
 
   def _set_free_variable(self, name, value):
-    if name in self._locals:
-      existing_value = self[name]
-      if isinstance(existing_value, CellObject):
-        existing_value.pobject = value
-        return
+    existing_value = self._locals.get(name, _MISSING)
+    if type(existing_value) is CellObject:
+      existing_value.pobject = value
+      return
     self._locals[name] = value
 
   def __setitem__(self, variable: Expression, value: PObject):
     # https://stackoverflow.com/questions/38937721/global-frame-vs-stack-frame
-    if not isinstance(value, PObject):
-      value = pobject_from_object(value)  # Wrap everything in FuzzyObjects.
+    value = _to_validated_pobject(value)
     # TODO: Handle nonlocal & global keyword states and cells.
-    if isinstance(value, FuzzyObject):
-      value.validate()
+    setter = _SETTERS.get(type(variable))
+    if setter is None:  # Subclass of one of the supported types.
+      setter = next((setter for type_, setter in _SETTERS.items() if isinstance(variable, type_)), None)
+      assert setter is not None, variable
+    setter(self, variable, value)
+
+  def set_name(self, name: str, value: PObject):
+    '''Fast path for __setitem__ for callers which know they're assigning to a plain name.'''
+    self._set_free_variable(name, _to_validated_pobject(value))
+
+  def set_names(self, names_to_values: Dict[str, PObject]):
+    '''Bulk set_name - e.g. for binding all of a function's parameters at once.'''
+    locals_ = self._locals
+    for name, value in names_to_values.items():
+      value = _to_validated_pobject(value)
+      existing_value = locals_.get(name, _MISSING)
+      if type(existing_value) is CellObject:
+        existing_value.pobject = value
+      else:
+        locals_[name] = value
 
-    if isinstance(variable, VariableExpression):
-      self._set_free_variable(variable.name, value)
-    elif isinstance(variable, str):
-      self._set_free_variable(variable, value)
-    elif isinstance(variable, SubscriptExpression):
-      variable.set(value)
-    else:
-      # TODO: Move this logic into AttributeExpression like SubscriptExpression?
-      assert isinstance(variable, AttributeExpression), variable
-      pobject = variable.base_expression.evaluate(self)
-      pobject.set_attribute(variable.attribute, value)
+  def _set_variable_expression(self, variable, value):
+    self._set_free_variable(variable.name, value)
+
+  def _set_subscript_expression(self, variable, value):
+    variable.set(value)
+
+  def _set_attribute_expression(self, variable, value):
+    # TODO: Move this logic into AttributeExpression like SubscriptExpression?
+    pobject = variable.base_expression.evaluate(self)
+    pobject.set_attribute(variable.attribute, value)
 
   def _get_current_filename(self):
-    return self._module.filename
+    return self._filename
 
   def __delitem__(self, variable):
     if isinstance(variable, str):
@@ -174,86 +217,134 @@ class Frame:
     assert isinstance(variable, VariableExpression)
     del self._locals[variable.name]
 
-  @dereference_cell_object_returns
-  def __getitem__(self, variable: Expression, raise_error_if_missing=False, nested=False) -> PObject:
-
-    if isinstance(variable, SubscriptExpression):
+  def __getitem__(self, variable: Expression, raise_error_if_missing=False) -> PObject:
+    # Exact type checks first for the common cases - isinstance checks against Expression
+    # subclasses go through ABCMeta.
+    variable_type = type(variable)
+    if variable_type is str:
+      name = variable
+    elif variable_type is VariableExpression:
+      name = variable.name
+    elif isinstance(variable, SubscriptExpression):
       return variable.get()
-    if isinstance(variable, AttributeExpression):
+    elif isinstance(variable, AttributeExpression):
       pobject = variable.base_expression.evaluate(self)
       return pobject.get_attribute(variable.attribute)
-
-    if isinstance(variable, str):
+    elif isinstance(variable, str):
       name = variable
     else:
       assert isinstance(variable, VariableExpression), variable
       name = variable.name
 
     # Complex case - X.b
-    if '.' in name:
-      path = name.split('.')
-      assert len(path) >= 2
-      # May raise a ValueError - recursive call.
-      pobject = self[path[0]]
-      for attribute_name in path[1:]:
+    base, sep, attribute_path = name.partition('.')
+    if sep:
+      # Never raises for the base.
+      pobject = self.get_name(base)
+      while attribute_path:
+        attribute_name, _, attribute_path = attribute_path.partition('.')
         if raise_error_if_missing and not pobject.has_attribute(attribute_name):
-          raise ValueError(f'{variable} doesn\'t exist in current context!')
+          raise KeyError(f'{variable} doesn\'t exist in current context!')
         pobject = pobject.get_attribute(attribute_name)
       return pobject
+    return self.get_name(name, raise_error_if_missing)
 
+  def get_name(self, name: str, raise_error_if_missing=False) -> PObject:
+    '''Fast path for __getitem__ for callers which know they have a plain (non-dotted) name.'''
     collector.add_referenced_symbol(self._get_current_filename(), name)
-    # Given a.b.c, Python will take the most-local definition of a and
-    # search from there.
-    # TODO: This hackishly makes nested functions sorta work. FIXME. == NORMAL + cells.
-    if name in self._locals:
-      return self._locals[name]
-
-    # We only want to dig into the stack up to the point of locals. If |name| isn't within any
-    # frame on the backstack's locals, then we don't want to dig in. This way, if the name isn't
-    # found at all, we are doing the logs from the highest-level frame as desired.
-    if (not nested or self._frame_type == FrameType.NORMAL) and self._back and self._back.__contains__(
-        name, True):
-      return self._back.__getitem__(name, nested=True)
-
-    if nested and raise_error_if_missing:
-      raise KeyError(f'{variable} doesn\'t exist in current context!')
-
-    if name in self._module._members:
-      return self._module._members[name]
-
-    if name in self._builtins:
-      return self._builtins[name]
-      # TODO: lineno, frame contents.
+    value = self._resolve(name)
+    if value is not _MISSING:
+      # Only scope lookups can produce CellObjects - so we only dereference them here.
+      if type(value) is CellObject:
+        if value.pobject is None:
+          # NameError: free variable 'a' referenced before assignment in enclosing scope
+          # raise CellValueNotSetError()
+          return UnknownObject('CellValueNotSetError')
+        return value.pobject
+      return value
 
     if raise_error_if_missing:
-      raise KeyError(f'{variable} doesn\'t exist in current context!')
+      raise KeyError(f'{name} doesn\'t exist in current context!')
     else:
       context_str = self.get_code_context_string()
       collector.add_missing_symbol(self._get_current_filename(), name, context_str)
       # Note: This can happen pretty often due to nuances in cases we don't handle. E.g. manually setting
       # globals, or sneaky conditionals (that we blow past) can cause this - so it's rather noisy and is thus
       # a debug instead of a warning.
-      debug(f'At: {context_str}')
-      debug(f'`{name}` doesn\'t exist in current context! Returning UnknownObject.')
+      if debug_enabled():
+        debug(f'At: {context_str}')
+        debug(f'`{name}` doesn\'t exist in current context! Returning UnknownObject.')
       return UnknownObject(f'frame[{name}]')
 
-  def __contains__(self, variable, nested=False):
+  def _get_local_scopes(self):
+    local_scopes = self._local_scopes
+    if local_scopes is None:
+      # Given a.b.c, Python will take the most-local definition of a and
+      # search from there.
+      # TODO: This hackishly makes nested functions sorta work. FIXME. == NORMAL + cells.
+      # _locals dicts are only ever mutated in-place and _back never changes, so this is stable.
+      if self._back:
+        local_scopes = (self._locals,) + self._back._get_scopes_visible_to_children()
+      else:
+        local_scopes = (self._locals,)
+      self._local_scopes = local_scopes
+    return local_scopes
+
+  def _get_scopes_visible_to_children(self):
+    # We only want to dig into the stack up to the point of locals - we always include the back
+    # Frame's locals, but only continue past it while the Frames are NORMAL. For NORMAL Frames,
+    # this is exactly their own (memoized) scopes, so children share the parent's work.
+    if self._frame_type is _NORMAL_FRAME_TYPE:
+      return self._get_local_scopes()
+    return (self._locals,)
+
+  def _resolve(self, name):
+    '''Resolves the simple (non-dotted) |name| in a single walk of the scopes visible from here.
+
+    Returns _MISSING if |name| can't be found. Otherwise, the value is returned as stored - i.e.
+    CellObjects are not dereferenced.'''
+    for scope in self._get_local_scopes():
+      value = scope.get(name, _MISSING)
+      if value is not _MISSING:
+        return value
+
+    value = self._module._members.get(name, _MISSING)
+    if value is not _MISSING:
+      return value
+
+    # TODO: lineno, frame contents.
+    return self._builtins.get(name, _MISSING)
+
+  def __contains__(self, variable):
+    # Same exact type checks as __getitem__ so plain names skip the isinstance checks.
+    variable_type = type(variable)
+    if variable_type is VariableExpression or (variable_type is not str and
+                                               isinstance(variable, VariableExpression)):
+      variable = variable.name
+    if isinstance(variable, str) and '.' not in variable:
+      return self._resolve(variable) is not _MISSING
     try:
-      self.__getitem__(variable, nested=nested, raise_error_if_missing=True)
+      self.__getitem__(variable, raise_error_if_missing=True)
       return True
     except KeyError:
       return False
 
   def add_return(self, value):
-    if not isinstance(value, PObject):
+    if type(value) not in _POBJECT_TYPES and not isinstance(value, PObject):
       value = pobject_from_object(value)
-    self._returns.append(value)
+    if self._returns is None:
+      self._returns = [value]
+    else:
+      self._returns.append(value)
 
   def get_returns(self):
     return FuzzyObject(self._returns) if self._returns else NONE_POBJECT
 
   def __str__(self):
-    return f'{[self._locals, self._builtins]} + {self._root}\n'
+    # Kept short - Frames are formatted in log messages and their symbol tables can be huge. Use
+    # dump for the full contents.
+    namespace_name = getattr(self.namespace, 'name', None)
+    return f'Frame({self._frame_type.name}, {namespace_name}, {len(self._locals)} locals)'
 
   def __repr__(self):
     return str(self)
@@ -270,3 +361,20 @@ class Frame:
         return f'File: "{filename}", line {line}, ({code})'
       return f'line {line}, ({code})'
     return filename
+
+
+def _to_validated_pobject(value):
+  if type(value) not in _POBJECT_TYPES and not isinstance(value, PObject):
+    return pobject_from_object(value)  # Wrap everything in FuzzyObjects.
+  if isinstance(value, FuzzyObject) and not value._validated:
+    value.validate()
+  return value
+
+
+# Handlers for Frame.__setitem__ keyed by the type of the variable being assigned to.
+_SETTERS = {
+    VariableExpression: Frame._set_variable_expression,
+    str: Frame._set_free_variable,
+    SubscriptExpression: Frame._set_subscript_expression,
+    AttributeExpression: Frame._set_attribute_expression
+}
@@ -13,6 +13,7 @@ So __getitem__, __getattribute__, __call__, etc. translate into get_item, get_at
 '''
 import itertools
 import os
+import sys
 from abc import ABC
 from enum import Enum
 from functools import wraps
@@ -21,12 +22,19 @@ from typing import Dict, Iterable
 import attr
 
 from . import collector, serialization, errors
-from ...nsn_logging import debug, error, warning
+from ...nsn_logging import debug, debug_enabled, error, warning
 from .errors import (NoDictImplementationError, SourceAttributeError, UnableToReadModuleFileError)
 from .frame import FrameType
 from .pobjects import (AugmentedObject, FuzzyBoolean, LanguageObject, LazyObject, NativeObject, PObject, UnknownObject, pobject_from_object, PObjectType)
 from .utils import attrs_names_from_class
 
+_MISSING = object()
+# Enum member lookups (e.g. PObjectType.NORMAL) go through EnumMeta.__getattr__, which is slow
+# enough to matter in per-argument loops. These are compared by identity instead.
+_NORMAL_POBJECT = PObjectType.NORMAL
+_STARRED_POBJECT = PObjectType.STARRED
+_FUZZY_TRUE = FuzzyBoolean.TRUE
+
 
 @attr.s(slots=True)
 class Namespace:
@@ -46,6 +54,9 @@ class Namespace:
   _members: Dict[str, PObject] = attr.ib(factory=dict)
 
   def __contains__(self, name):
+    if name in self._members:
+      return True
+    # Subclasses may resolve names which aren't members - e.g. submodules of packages.
     try:
       self[name]
       return True
@@ -54,10 +65,10 @@ class Namespace:
 
   # TODO: This is broken - Namespaces use the same thing for attributes and subscripts.
   def __getitem__(self, name):
-    try:
-      return self._members[name]  # TODO: Re-raise as SourceAttributeError
-    except KeyError as e:
-      raise SourceAttributeError(e)
+    value = self._members.get(name, _MISSING)
+    if value is _MISSING:
+      raise SourceAttributeError(repr(name))
+    return value
 
   def __setitem__(self, name, value):
     assert isinstance(value, PObject)
@@ -175,21 +186,21 @@ class ModuleImpl(Module):
     self._members['__loader__'] = UnknownObject('__loader__')
 
   def __getitem__(self, name):
-    try:
-      return super().__getitem__(name)
-    except SourceAttributeError as sae:
-      if not self.filename:
-        return UnknownObject(f'{self.name}.{name}')
-      if self._is_package:
-        module_key = self.module_loader.module_key_from_name(f'.{name}',
-                                                                  os.path.dirname(self.filename))[0]
-
-        if not module_key.is_bad():
-          try:
-            return AugmentedObject(self.module_loader.get_module_from_key(module_key, unknown_fallback=False))
-          except errors.InvalidModuleError as e:
-            pass
-      raise sae
+    value = self._members.get(name, _MISSING)
+    if value is not _MISSING:
+      return value
+    if not self.filename:
+      return UnknownObject(f'{self.name}.{name}')
+    if self._is_package:
+      module_key = self.module_loader.module_key_from_name(f'.{name}',
+                                                                os.path.dirname(self.filename))[0]
+
+      if not module_key.is_bad():
+        try:
+          return AugmentedObject(self.module_loader.get_module_from_key(module_key, unknown_fallback=False))
+        except errors.InvalidModuleError as e:
+          pass
+    raise SourceAttributeError(repr(name))
 
   def serialize(self, **kwargs):
     # Note, this is being done s.t. it works with subclasses - namely LazyModule.
@@ -225,22 +236,6 @@ class SimplePackageModule(ModuleImpl):
   ...
 
 
-def _lazy_load(func):
-  @wraps(func)
-  def _wrapper(self, *args, **kwargs):
-    self.load()
-    if self._loading:
-      # debug(f'Lazily loading from: {self.filename}')
-      # So, curiously, this is more allowed than I would think. ctypes does this with _endian
-      # where ctypes imports some stuff from _endian and the latter imports everything from
-      # ctypes - however, the ordering seems carefully done such that the _endian import in
-      # ctypes is well after most of it's members are defined - so, the module is mostly defined.
-      warning(f'Already lazy-loading module... dependency cycle? {self.name}. Or From import?')
-    return func(self, *args, **kwargs)
-
-  return _wrapper
-
-
 def _passthrough_to_super_if_loaded(func):
   @wraps(func)
   def wrapper(self, *args, **kwargs):
@@ -251,7 +246,7 @@ def _passthrough_to_super_if_loaded(func):
   return wrapper
 
 
-@attr.s(str=False, repr=False)
+@attr.s(str=False, repr=False, slots=True)
 class LazyModule(ModuleImpl):
   '''A Module which is lazily loaded with members.
 
@@ -287,6 +282,8 @@ class LazyModule(ModuleImpl):
       error(f'Unable to lazily load {self.filename}')
     else:
       self._loaded = True
+      # Nothing is lazy anymore - skip the lazy-loading checks on all further member accesses.
+      self.__class__ = _LoadedLazyModule
     finally:
       self._loading_failed = not self._loaded
       self._loading = False
@@ -295,8 +292,18 @@ class LazyModule(ModuleImpl):
     self.load()
     return self
 
-  @_lazy_load
+  def _ensure_loaded(self):
+    self.load()
+    if self._loading:
+      # debug(f'Lazily loading from: {self.filename}')
+      # So, curiously, this is more allowed than I would think. ctypes does this with _endian
+      # where ctypes imports some stuff from _endian and the latter imports everything from
+      # ctypes - however, the ordering seems carefully done such that the _endian import in
+      # ctypes is well after most of it's members are defined - so, the module is mostly defined.
+      warning(f'Already lazy-loading module... dependency cycle? {self.name}. Or From import?')
+
   def __contains__(self, name):
+    self._ensure_loaded()
     return super().__contains__(name)
 
   def _get_item_loaded(self, name):
@@ -312,20 +319,17 @@ class LazyModule(ModuleImpl):
     return self._get_item_loaded(name)
     # return super().__getitem__(name)
 
-  def __setitem__(self, name, value):
-    super().__setitem__(name, value)
-
-  @_lazy_load
   def get_members(self):
+    self._ensure_loaded()
     return super().get_members()
 
-  @_lazy_load
   def items(self):
+    self._ensure_loaded()
     return super().items()
 
-  @_lazy_load
   def keys(self):
-    return super().items()
+    self._ensure_loaded()
+    return super().keys()
 
   def serialize(self, **kwargs):
     assert not self._loading
@@ -341,39 +345,85 @@ class LazyModule(ModuleImpl):
     return str(self)
 
 
+class _LoadedLazyModule(LazyModule):
+  '''A LazyModule which has been successfully loaded.
+
+  LazyModule.load switches loaded modules over to this class so member access goes straight to
+  ModuleImpl's implementations rather than through LazyModule's lazy-loading wrappers.'''
+  # Must match LazyModule's layout for the __class__ swap.
+  __slots__ = ()
+  __contains__ = ModuleImpl.__contains__
+  __getitem__ = ModuleImpl.__getitem__
+  get_members = ModuleImpl.get_members
+  items = ModuleImpl.items
+  keys = ModuleImpl.keys
+
+
 @attr.s(str=False, repr=False, slots=True)
 class Klass(Namespace, LanguageObject):
   name: str = attr.ib()
   module_name: 'str' = attr.ib()
   _members: Dict[str, PObject] = attr.ib(factory=dict)
+  # ([(name, function)], {name: member}) - the members which are bound as methods on new instances
+  # and the members which are copied onto them as-is. Lazily built by new and reset whenever members
+  # change.
+  _instance_members = attr.ib(None, init=False, cmp=False)
 
   def __attrs_post_init__(self):
     # https://www.python.org/dev/peps/pep-3155/#discussion
     self._members['__name__'] = self._members['__qualname__'] = NativeObject(self.name)
 
+  def __setitem__(self, name, value):
+    self._instance_members = None
+    super().__setitem__(name, value)
+
+  def add_members(self, members):
+    self._instance_members = None
+    self._members.update(members)
+
   def call(self, curr_frame, args, kwargs):
     return AugmentedObject(self.new(curr_frame, args, kwargs))
 
+  def _get_instance_members(self):
+    if self._instance_members is None:
+      methods = []
+      data_members = {}
+      for name, member in self.items():
+        # This AugmentedObject bit is a small, but rather helpful cheat. Any functions
+        # actually defined within this class should be AugmentedObjects. This avoid's risking loading
+        # a LazyObject prematurely.
+        if isinstance(member, AugmentedObject) and member.value_is_a(
+            Function) is _FUZZY_TRUE:  # and value.type == FunctionType.UNBOUND_INSTANCE_METHOD:
+          # TODO: This can raise an exception for FuzzyObjects
+          methods.append((name, member.value()))
+        else:
+          # Namespace.__setitem__ would do this for every new instance otherwise.
+          if isinstance(member, LazyObject):
+            member = member.load_and_ret()
+          data_members[name] = member
+      self._instance_members = methods, data_members
+    return self._instance_members
+
   def new(self, curr_frame, args, kwargs):
-    debug(f'Creating instance of {self.name}')
+    if debug_enabled():
+      debug(f'Creating instance of {self.name}')
     # TODO: Handle params.
     # TODO: __init__
-    instance = Instance(self)
-    for name, member in self.items():
-      # This AugmentedObject bit is a small, but rather helpful cheat. Any functions
-      # actually defined within this class should be AugmentedObjects. This avoid's risking loading
-      # a LazyObject prematurely.
-      if isinstance(member, AugmentedObject) and member.value_is_a(
-          Function) == FuzzyBoolean.TRUE:  # and value.type == FunctionType.UNBOUND_INSTANCE_METHOD:
-        value = member.value()  # TODO: This can raise an exception for FuzzyObjects
-        new_func = value.bind([AugmentedObject(self)], {})
-        new_func.function_type = FunctionType.BOUND_INSTANCE_METHOD
-        instance[name] = AugmentedObject(new_func)
-      else:
-        instance[name] = member
-
-    if '__init__' in instance:
-      instance['__init__'].value().call(curr_frame, args, kwargs)
+    # Members are gathered directly rather than through Instance.__setitem__ - they've already been
+    # checked when building the instance members.
+    methods, data_members = self._get_instance_members()
+    members = data_members.copy()
+    # Each instance needs its own receiver - it holds the attributes set on self - but it can be shared
+    # across that instance's methods.
+    bound_args = [AugmentedObject(self)]
+    for name, function in methods:
+      new_func = function.bind(bound_args, {}, _BOUND_INSTANCE_METHOD)
+      members[name] = AugmentedObject(new_func)
+    instance = Instance(self, members)
+
+    init = members.get('__init__')
+    if init is not None:
+      init.value().call(curr_frame, args, kwargs)
 
     return instance
 
@@ -427,6 +477,9 @@ class FunctionType(Enum):
     return FunctionType.__qualname__, self.value
 
 
+_BOUND_INSTANCE_METHOD = FunctionType.BOUND_INSTANCE_METHOD
+
+
 class Function(Namespace, LanguageObject):
   ...
 
@@ -434,7 +487,7 @@ class Function(Namespace, LanguageObject):
     return StubFunction(self.name, self.parameters, None)
 
 
-@attr.s(str=False, repr=False)
+@attr.s(str=False, repr=False, slots=True)
 class FunctionImpl(Function):
   '''FunctionImpl is a Function with it's inner CFG included.
 
@@ -455,10 +508,16 @@ class FunctionImpl(Function):
   _cell_symbols: Iterable[str] = attr.ib()
   _type = attr.ib(FunctionType.FREE)
   _members: Dict = attr.ib(factory=dict)
+  # Whether every parameter is a plain (non-*, non-**) one - enables _process_simple_args.
+  _only_single_parameters = attr.ib(False, init=False)
+
+  def __attrs_post_init__(self):
+    self._only_single_parameters = all(
+        param.parameter_type is _SINGLE_PARAMETER for param in self.parameters)
 
   # TODO: Cell vars.
-  def bind(self, args, kwargs) -> 'BoundFunction':
-    return BoundFunction(self, args, kwargs)
+  def bind(self, args, kwargs, function_type=FunctionType.FREE) -> 'BoundFunction':
+    return BoundFunction(self, args, kwargs, function_type=function_type)
 
   def call_inner(self, curr_frame, args, kwargs, bound_locals):
     if curr_frame.contains_namespace_on_stack(self):
@@ -483,30 +542,34 @@ class FunctionImpl(Function):
     return self.call_inner(curr_frame, args, kwargs, bound_locals={})
 
   def _process_args(self, args, kwargs, new_frame):
+    if self._only_single_parameters and all(arg.pobject_type is _NORMAL_POBJECT for arg in args):
+      self._process_simple_args(args, kwargs, new_frame)
+      return
+
     # As a sort of safety measure, we explicitly provide some value for every single param - this
     # avoids any issues with missing symbols when processing the function if it was called with
     # invalid arguments.
 
     # TODO: Perhaps don't call into it in that case instead as Python should do as well? This
     # could/will probably leak through bugs.
-    for param in self.parameters:
-      new_frame[param.name] = UnknownObject(param.name)
+    # Parameter values are collected here and bound into new_frame all at once at the end.
+    assignments = {param.name: UnknownObject(param.name) for param in self.parameters}
 
     # Process positional arguments.
     param_iter = iter(self.parameters)
     arg_iter = iter(args)
     for arg, param in zip(arg_iter, param_iter):
-      if param.parameter_type == ParameterType.SINGLE:
-        if arg.pobject_type != PObjectType.NORMAL:  # Passed *iterable or **dict.
-          if arg.pobject_type == PObjectType.STARRED:
+      if param.parameter_type is _SINGLE_PARAMETER:
+        if arg.pobject_type is not _NORMAL_POBJECT:  # Passed *iterable or **dict.
+          if arg.pobject_type is _STARRED_POBJECT:
             iterator = iter(arg.iterator())
             try:
-              new_frame[param.name] = next(iterator)
+              assignments[param.name] = next(iterator)
             except StopIteration:
               # Prepend param back to param_iter to ensure we set it in kwargs section.
               param_iter = itertools.chain([param], param_iter)
             for evaluated_arg, param in zip(iterator, param_iter):
-              new_frame[param.name] = evaluated_arg
+              assignments[param.name] = evaluated_arg
             break  # No more positionals allowed after *iterable.
           else:  # **dict
             try:
@@ -515,36 +578,36 @@ class FunctionImpl(Function):
               kwarg_remaining = {}
               param_set = set()
               for param in itertools.chain([param], param_iter):
-                if param.parameter_type == ParameterType.SINGLE:
+                if param.parameter_type is _SINGLE_PARAMETER:
                   param_set.add(param.name)
-                elif param.parameter_type == ParameterType.KWARGS:
+                elif param.parameter_type is _KWARGS_PARAMETER:
                   kwarg_param_name = param.name
 
               for key, value in input_kwargs_dict.items():
                 value = pobject_from_object(value)
                 if key in param_set:
-                  new_frame[key] = value
+                  assignments[key] = value
                 else:
                   kwarg_remaining[key] = value
               if kwarg_param_name:
-                new_frame[kwarg_param_name] = pobject_from_object(kwarg_remaining)
+                assignments[kwarg_param_name] = pobject_from_object(kwarg_remaining)
               elif kwarg_remaining:  # non-empty.
                 error(f'No **kwargs but had unassigned kwargs: {kwarg_remaining}')
             except NoDictImplementationError:
               pass  # Non-NativeObject. Too fancy for us.
             break
         # Normal case.
-        new_frame[param.name] = arg
-      elif param.parameter_type == ParameterType.ARGS:
+        assignments[param.name] = arg
+      elif param.parameter_type is _ARGS_PARAMETER:
         # Collect all remaining positional arguments into *args param
         args = []
         for a in itertools.chain([arg], arg_iter):
-          if a.pobject_type == PObjectType.STARRED:  # Passing in *iterable.
+          if a.pobject_type is _STARRED_POBJECT:  # Passing in *iterable.
             args += list(a.iterator())
           else:  # Normal positional.
             args.append(a)
 
-        new_frame[param.name] = pobject_from_object(args)
+        assignments[param.name] = pobject_from_object(args)
         break
       else:  # KWARGS
         error(f'Invalid number of positionals. {arg}: {args} fitting {self.parameters}')
@@ -552,21 +615,32 @@ class FunctionImpl(Function):
     # Process keyword-arguments.
     kwargs_name = None
     for param in param_iter:
-      if param.name in kwargs:
-        new_frame[param.name] = kwargs[param.name]
-      elif param.parameter_type == ParameterType.KWARGS:
+      value = kwargs.get(param.name, _MISSING)
+      if value is not _MISSING:
+        assignments[param.name] = value
+      elif param.parameter_type is _KWARGS_PARAMETER:
         kwargs_name = param.name
       else:
         # Use default. If there's no assignment and no explicit default, this
         # will be NONE_POBJECT.
-        new_frame[param.name] = param.default_value
+        assignments[param.name] = param.default_value
 
     if kwargs_name:  # Add remaining keywords to kwargs if there is one.
-      in_dict = {}
-      for key, value in kwargs.items():
-        if key not in new_frame:
-          in_dict[key] = value
-      new_frame[kwargs_name] = pobject_from_object(in_dict)  # NativeObject.
+      # Only keywords which don't match a parameter - not any name visible from new_frame.
+      in_dict = {key: value for key, value in kwargs.items() if key not in assignments}
+      assignments[kwargs_name] = pobject_from_object(in_dict)  # NativeObject.
+    new_frame.set_names(assignments)
+
+  def _process_simple_args(self, args, kwargs, new_frame):
+    '''_process_args for the common case of plain parameters and no *iterable/**dict args.'''
+    assignments = {}
+    # Extra positionals are ignored, as in _process_args.
+    for param, arg in zip(self.parameters, args):
+      assignments[param.name] = arg
+    for param in itertools.islice(self.parameters, len(args), None):
+      value = kwargs.get(param.name, _MISSING)
+      assignments[param.name] = param.default_value if value is _MISSING else value
+    new_frame.set_names(assignments)
 
   def serialize(self, **kwargs):
     return serialization.serialize(self.to_stub(), **kwargs)
@@ -578,6 +652,17 @@ class FunctionImpl(Function):
     return str(self)
 
 
+def _merge_dicts(first, second):
+  '''Equivalent to {**first, **second} - but avoids copying when either is empty.
+
+  Note that this means the result may be |first| or |second| itself, so it must not be mutated.'''
+  if not second:
+    return first
+  if not first:
+    return second
+  return {**first, **second}
+
+
 @attr.s(str=False, repr=False, slots=True)
 class BoundFunction(Function):
   _function = attr.ib(validator=attr.validators.instance_of(Function))
@@ -588,31 +673,35 @@ class BoundFunction(Function):
   _bound_kwargs = attr.ib(factory=dict)
   _bound_locals = attr.ib(factory=dict)  # For nested functions.
   _members: Dict = attr.ib(factory=dict)
+  function_type: FunctionType = attr.ib(FunctionType.FREE, kw_only=True)
 
   def __attrs_post_init__(self):
     self.name = self._function.name
     # container_parameters = list(self._function.parameters)
     # remaining_parameters = container_parameters[len(self._bound_args):]
-    self.parameters = filter(lambda param: param.name not in self._bound_kwargs, self._function.parameters)
+    bound_kwargs = self._bound_kwargs
+    if bound_kwargs:
+      self.parameters = [
+          param for param in self._function.parameters if param.name not in bound_kwargs
+      ]
+    else:  # Nothing to filter - e.g. methods bound by Klass.new. parameters is never mutated.
+      self.parameters = self._function.parameters
 
   # TODO: Cell vars.
-  def bind(self, args, kwargs) -> 'BoundFunction':
-    return BoundFunction(self, args, kwargs)
+  def bind(self, args, kwargs, function_type=FunctionType.FREE) -> 'BoundFunction':
+    return BoundFunction(self, args, kwargs, function_type=function_type)
 
   def call_inner(self, curr_frame, args, kwargs, bound_locals):
-    return self._function.call_inner(curr_frame, self._bound_args + args, {
-        **kwargs,
-        **self._bound_kwargs
-    }, {
-        **bound_locals,
-        **self._bound_locals
-    })
+    return self._function.call_inner(curr_frame, self._get_args(args),
+                                     _merge_dicts(kwargs, self._bound_kwargs),
+                                     _merge_dicts(bound_locals, self._bound_locals))
 
   def call(self, curr_frame, args, kwargs, reuse_curr_frame=False):
-    return self._function.call_inner(curr_frame, self._bound_args + args, {
-        **kwargs,
-        **self._bound_kwargs
-    }, self._bound_locals)
+    return self._function.call_inner(curr_frame, self._get_args(args),
+                                     _merge_dicts(kwargs, self._bound_kwargs), self._bound_locals)
+
+  def _get_args(self, args):
+    return self._bound_args + args if self._bound_args else args
 
   def serialize(self, **kwargs):
     return serialization.serialize(self.to_stub(), **kwargs)
@@ -664,9 +753,15 @@ class ParameterType(Enum):
     return ParameterType.__qualname__, self.value
 
 
+_SINGLE_PARAMETER = ParameterType.SINGLE
+_ARGS_PARAMETER = ParameterType.ARGS
+_KWARGS_PARAMETER = ParameterType.KWARGS
+
+
 @attr.s(str=False, repr=False, slots=True, frozen=True)
 class Parameter:
-  name: str = attr.ib()
+  # Interned so frame keys share identity with (interned) VariableExpression names.
+  name: str = attr.ib(converter=sys.intern)
   parameter_type: 'ParameterType' = attr.ib()
   type_hint_expression: 'PObject' = attr.ib(kw_only=True)
   default_expression: 'Expression' = attr.ib(None, kw_only=True)  # TODO: Rename default_expression
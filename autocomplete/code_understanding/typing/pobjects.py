@@ -7,7 +7,7 @@ from typing import List
 import attr
 
 from . import collector, serialization
-from ...nsn_logging import debug, error, info, warning
+from ...nsn_logging import debug, debug_enabled, error, info, warning
 from .errors import (AmbiguousFuzzyValueError, LoadingModuleAttributeError, NoDictImplementationError,
                      SourceAttributeError)
 from .utils import to_dict_iter
@@ -20,7 +20,8 @@ _OPERATORS = [
 
 
 class LanguageObject:
-  ...
+  # Empty so slotted subclasses (Klass, Instance, Module, ...) don't get a __dict__.
+  __slots__ = ()
 
 
 class FuzzyBoolean(Enum):
@@ -209,20 +210,39 @@ class DynamicContainer:
     return str(self)
 
 
+# Most PObjects never have attributes set on them dynamically, so their DynamicContainers are only
+# created when first needed.
+def _get_dynamic_container(pobject) -> DynamicContainer:
+  dynamic_container = pobject._dynamic_container
+  if dynamic_container is None:
+    dynamic_container = pobject._dynamic_container = DynamicContainer()
+  return dynamic_container
+
+
+def _dynamic_container_has_attribute(pobject, name) -> bool:
+  dynamic_container = pobject._dynamic_container
+  return dynamic_container is not None and dynamic_container.has_attribute(name)
+
+
+def _dynamic_container_str(pobject) -> str:
+  dynamic_container = pobject._dynamic_container
+  return str(dynamic_container) if dynamic_container is not None else '[]'
+
+
 @attr.s(str=False, repr=False, slots=True)
 class UnknownObject(PObject):
   name = attr.ib()  # For recording source of value - e.g. functools.wraps.
   imported = attr.ib(False)
-  _dynamic_container = attr.ib(init=False, factory=DynamicContainer)
+  _dynamic_container = attr.ib(init=False, default=None)
 
   def has_attribute(self, name):
-    return self._dynamic_container.has_attribute(name)
+    return _dynamic_container_has_attribute(self, name)
 
   def get_attribute(self, name):
-    return self._dynamic_container.get_attribute(name)
+    return _get_dynamic_container(self).get_attribute(name)
 
   def set_attribute(self, name, value):
-    self._dynamic_container.set_attribute(name, value)
+    _get_dynamic_container(self).set_attribute(name, value)
 
   def apply_to_values(self, func):
     func(self)
@@ -251,7 +271,7 @@ class UnknownObject(PObject):
     ...
 
   def __str__(self):
-    return f'UO({self._dynamic_container})'
+    return f'UO({_dynamic_container_str(self)})'
 
   def __repr__(self):
     return str(self)
@@ -273,11 +293,11 @@ def is_subtype(super_type, sub_type):
   return FuzzyBoolean.FALSE
 
 
-@attr.s
+@attr.s(slots=True)
 class TypeOnlyObject(PObject):
   pobject_type = PObjectType.NORMAL
   underlying_type = attr.ib()
-  _dynamic_container = attr.ib(factory=DynamicContainer, init=False)
+  _dynamic_container = attr.ib(init=False, default=None)
 
   # def __attrs_post_init__(self):
   #   self.underlying_type = maybe_wrap_type(self.underlying_type)
@@ -294,7 +314,7 @@ class TypeOnlyObject(PObject):
     return hasattr(self.underlying_type, name)
 
   def set_attribute(self, name, value):
-    self._dynamic_container[name] = value
+    _get_dynamic_container(self).set_attribute(name, value)
 
   def apply_to_values(self, func):
     raise ValueError()
@@ -358,23 +378,24 @@ class NativeObject(PObject):
   _native_object = attr.ib()
   _read_only = attr.ib(False)
   imported = attr.ib(False)
-  _dynamic_container = attr.ib(init=False, factory=DynamicContainer)
+  _dynamic_container = attr.ib(init=False, default=None)
 
   def has_attribute(self, name):
-    return hasattr(self._native_object, name) or self._dynamic_container.has_attribute(name)
+    return hasattr(self._native_object, name) or _dynamic_container_has_attribute(self, name)
 
   def get_attribute(self, name):
     try:
       native_object = getattr(self._native_object, name)
     except AttributeError as e:  # E.g. <str>.get_attribute
       # TODO: Support for some native objects - str, int, list perhaps.
-      debug(f'Failed to access {name} from {self._native_object}. {e}')
+      if debug_enabled():
+        debug(f'Failed to access {name} from {self._native_object}. {e}')
     else:
       return pobject_from_object(native_object, self._read_only)
-    return self._dynamic_container.get_attribute(name)
+    return _get_dynamic_container(self).get_attribute(name)
 
   def set_attribute(self, name, value):
-    self._dynamic_container.set_attribute(name, value)
+    _get_dynamic_container(self).set_attribute(name, value)
 
   def apply_to_values(self, func):
     func(self._native_object)
@@ -565,7 +586,7 @@ class LazyObject(PObject):
   # _loaded = attr.ib(init=False, default=False)
   _loading = attr.ib(init=False, default=False)
   _loading_failed = attr.ib(init=False, default=False)
-  _dynamic_container = attr.ib(init=False, factory=DynamicContainer)
+  _dynamic_container = attr.ib(init=False, default=None)
   _deferred_operations = attr.ib(init=False, factory=list)
   _deferred_funcs = attr.ib(init=False, factory=list)
 
@@ -613,8 +634,9 @@ class LazyObject(PObject):
   def _apply_deferred_to_loaded(self):
     # Okay, this is a touch questionable it feels like since theoretically, ordering of events
     # *could* matter?
-    for name, value in self._dynamic_container.items():
-      self._loaded_object.set_attribute(name, value)
+    if self._dynamic_container is not None:
+      for name, value in self._dynamic_container.items():
+        self._loaded_object.set_attribute(name, value)
 
     for operation in self._deferred_operations:
       operation()
@@ -641,7 +663,7 @@ class LazyObject(PObject):
 
   @_passthrough_if_loaded
   def set_attribute(self, name, value):
-    self._dynamic_container.set_attribute(name, value)
+    _get_dynamic_container(self).set_attribute(name, value)
 
   @_passthrough_if_loaded
   def apply_to_values(self, func):
@@ -749,28 +771,29 @@ def _pretty(obj):
 class AugmentedObject(PObject):  # TODO: CallableInterface
   _object = attr.ib()
   imported = attr.ib(False)
-  _dynamic_container = attr.ib(init=False, factory=DynamicContainer)
+  _dynamic_container = attr.ib(init=False, default=None)
 
   def __attrs_post_init__(self):
     assert self._object is not None
 
   def has_attribute(self, name):
-    return self._object.has_attribute(name) or self._dynamic_container.has_attribute(name)
+    return self._object.has_attribute(name) or _dynamic_container_has_attribute(self, name)
 
   def get_attribute(self, name):
     try:
       return self._object.get_attribute(name)
     except (SourceAttributeError, LoadingModuleAttributeError):
       # TODO: Log
-      debug(f'Failed to access {name} from {self._object}')
-    return self._dynamic_container.get_attribute(name)
+      if debug_enabled():
+        debug(f'Failed to access {name} from {self._object}')
+    return _get_dynamic_container(self).get_attribute(name)
 
   def set_attribute(self, name, value):
     # Can this get messy at all?
     if self._object.has_attribute(name):
       self._object.set_attribute(name, value)
     else:
-      self._dynamic_container.set_attribute(name, value)
+      _get_dynamic_container(self).set_attribute(name, value)
 
   def apply_to_values(self, func):
     func(self._object)
@@ -798,9 +821,11 @@ class AugmentedObject(PObject):  # TODO: CallableInterface
     return FuzzyBoolean.TRUE if value else FuzzyBoolean.FALSE
 
   def call(self, curr_frame, args, kwargs):
-    if hasattr(self._object, 'call'):
-      return self._object.call(curr_frame, args, kwargs)
-    return UnknownObject('Call?')
+    try:
+      call = self._object.call
+    except AttributeError:
+      return UnknownObject('Call?')
+    return call(curr_frame, args, kwargs)
 
   def get_item(self, curr_frame, index_pobject):
     if isinstance(self._object, PObject):
@@ -826,7 +851,7 @@ class AugmentedObject(PObject):  # TODO: CallableInterface
     return serialization.serialize(self._object, **kwargs)
 
   def __str__(self):
-    return f'AO({self._object})DC({self._dynamic_container})'
+    return f'AO({self._object})DC({_dynamic_container_str(self)})'
 
   def __repr__(self):
     return str(self)
@@ -854,24 +879,26 @@ class FuzzyObject(PObject):
 
   _values: List = attr.ib()  # Tuple of possible values
   imported = attr.ib(False)
+  # Set once _values has been checked to only contain PObjects so it isn't redone on every use. May be
+  # passed in by callers which already know their values are all PObjects.
+  _validated = attr.ib(False, kw_only=True, cmp=False)
 
   @_values.validator
   def _values_valid(self, attribute, values):
-    assert all(isinstance(value, PObject) for value in values)
-
-  def __attrs_post_init(self):
-    # new_values = []
-    # for val in self._values:
-    #   # Flatten FuzzyObjects?
-    #   if isinstance(val, FuzzyObject):
-    #     new_values += val._values
-    #   else:
-    #     new_values.append(val)
-    # self._values = new_values
     self.validate()
 
   def validate(self):
-    assert all(isinstance(value, PObject) for value in self._values)
+    if not self._validated:
+      assert all(isinstance(value, PObject) for value in self._values)
+      self._validated = True
+
+  @classmethod
+  def _from_pobjects(cls, values: List[PObject]) -> 'FuzzyObject':
+    '''Creates a FuzzyObject from |values| which are already known to all be PObjects.
+
+    This skips the validation pass in __init__ - which isinstance-checks every value against the
+    PObject ABC - for internal callers which have already checked or constructed their values.'''
+    return cls(values, validated=True)
 
   def __str__(self):
     return f'FV({self._values})'
@@ -881,17 +908,22 @@ class FuzzyObject(PObject):
 
   def merge(self, other: 'FuzzyObject'):
     # dvs = list(filter(lambda x: x is not None, [self._dynamic_container, other._dynamic_container]))
-    return FuzzyObject(self._values + other._values)
+    return FuzzyObject._from_pobjects(self._values + other._values)
 
   def has_single_value(self):
     return len(self._values) == 1
 
   def value(self) -> object:
-    if not self.has_single_value():
-      raise AmbiguousFuzzyValueError(f'Does not have a single value: {self._values}')
-    if isinstance(self._values[0], PObject):  # Follow the rabbit hole.
-      return self._values[0].value()
-    return self._values[0]
+    # Unwrap directly nested FuzzyObjects iteratively rather than recursing through each level.
+    pobject = self
+    while isinstance(pobject, FuzzyObject):
+      values = pobject._values
+      if len(values) != 1:
+        raise AmbiguousFuzzyValueError(f'Does not have a single value: {values}')
+      pobject = values[0]
+    if isinstance(pobject, PObject):  # Follow the rabbit hole.
+      return pobject.value()
+    return pobject
 
   # def could_be_true_or_false(self):
   #   # Ambiguous if there is a mix of False and True.
@@ -899,17 +931,24 @@ class FuzzyObject(PObject):
   #           len(self._values) > 0)
 
   def has_attribute(self, name):
-    return all([value.has_attribute(name) for value in self._values])
+    return all(value.has_attribute(name) for value in self._values)
 
   # TODO Check _values
 
-  def get_attribute(self, name) -> 'FuzzyObject':
-    return FuzzyObject([value.get_attribute(name) for value in self._values])
+  def get_attribute(self, name) -> PObject:
+    values = self._values
+    if len(values) == 1:  # Like call and get_item, don't wrap a single result.
+      return values[0].get_attribute(name)
+    return FuzzyObject([value.get_attribute(name) for value in values])
 
   def set_attribute(self, name: str, value):
     if not isinstance(value, PObject):
       value = pobject_from_object(value)
-    for val in self._values:
+    values = self._values
+    if len(values) == 1:
+      values[0].set_attribute(name, value)
+      return
+    for val in values:
       val.set_attribute(name, value)
 
   def apply_to_values(self, func):
@@ -942,12 +981,16 @@ class FuzzyObject(PObject):
     return FuzzyBoolean.FALSE
 
   def bool_value(self) -> FuzzyBoolean:
-    truths = [value.bool_value() == FuzzyBoolean.TRUE for value in self._values]
-    if all(truth for truth in truths):
-      return FuzzyBoolean.TRUE
-    elif any(truth for truth in truths):
-      return FuzzyBoolean.MAYBE
-    return FuzzyBoolean.FALSE
+    # Single pass which stops as soon as we've seen both a true and a non-true value.
+    saw_true = saw_non_true = False
+    for value in self._values:
+      if value.bool_value() == FuzzyBoolean.TRUE:
+        saw_true = True
+      else:
+        saw_non_true = True
+      if saw_true and saw_non_true:
+        return FuzzyBoolean.MAYBE
+    return FuzzyBoolean.FALSE if saw_non_true else FuzzyBoolean.TRUE
 
   def apply(self, func):
     for value in self._values:
@@ -960,7 +1003,7 @@ class FuzzyObject(PObject):
       assert isinstance(result, PObject)
       out.append(result)
     if len(out) > 1:
-      return FuzzyObject(out)
+      return FuzzyObject._from_pobjects(out)
     elif out:  # len(out) == 1
       return out[0]
     raise EmptyFuzzyValueError()
@@ -972,13 +1015,14 @@ class FuzzyObject(PObject):
       assert isinstance(result, PObject)
       out.append(result)  # TODO: Add API get_item_processed_args
     if len(out) > 1:
-      return FuzzyObject(out)
+      return FuzzyObject._from_pobjects(out)
     elif out:  # len(out) == 1
       return out[0]
     return UnknownObject(f'FV[{index_pobject}]')
 
   def set_item(self, curr_frame, index, value):
-    debug(f'Skipping setting FV[{index}] = {value}')
+    if debug_enabled():
+      debug(f'Skipping setting FV[{index}] = {value}')
 
   def _operator(self, other, operator):
     try:
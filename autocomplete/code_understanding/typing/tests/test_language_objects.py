@@ -0,0 +1,34 @@
+from .. import module_loader
+from ..language_objects import Klass
+
+
+def test_klass_equality_after_new():
+  a = Klass('K', 'mod')
+  b = Klass('K', 'mod')
+  assert a == b
+  a.new(None, [], {})
+  assert a == b
+  b.new(None, [], {})
+  assert a == b
+
+
+def test_instances_have_separate_self():
+  source = '''
+class A:
+  def __init__(self, v):
+    self.v = v
+  def get(self):
+    return self.v
+a = A(5)
+a2 = A(6)
+x = a.get()
+y = a2.get()
+'''
+  module = module_loader.load_module_from_source(source, __file__)
+  assert module['x'].value() == 5
+  assert module['y'].value() == 6
+
+
+if __name__ == "__main__":
+  test_klass_equality_after_new()
+  test_instances_have_separate_self()
@@ -36,6 +36,43 @@ e = 2j # TODO: Add support for 1+2j
   # assert module['e'].instance_of(complex).truth()
 
 
+def test_kwargs_keeps_builtin_names():
+  source = '''
+def f(**kw):
+  return kw
+a = f(len=1)
+'''
+  module = module_loader.load_module_from_source(source, __file__)
+  assert 'len' in module['a'].value()
+
+
+def test_simple_and_general_args_bind_the_same():
+  # f only has plain parameters, so calls without starred args bind through
+  # FunctionImpl._process_simple_args; the *rest parameter forces g through the general path.
+  source = '''
+def f(a, b=2, c=3):
+  return [a, b, c]
+def g(a, b=2, c=3, *rest):
+  return [a, b, c]
+f_positional = f(1, 5, 6)
+g_positional = g(1, 5, 6)
+f_keyword = f(c=6, a=1)
+g_keyword = g(c=6, a=1)
+f_default = f(1)
+g_default = g(1)
+f_starred = f(*[1, 5], c=6)
+g_starred = g(*[1, 5], c=6)
+'''
+  module = module_loader.load_module_from_source(source, __file__)
+
+  def bound(name):
+    return [value.value() for value in module[name].value()]
+
+  assert bound('f_positional') == [1, 5, 6]
+  for call in ('positional', 'keyword', 'default', 'starred'):
+    assert bound(f'f_{call}') == bound(f'g_{call}'), call
+
+
 if __name__ == "__main__":
   test_simple_assignment()
   test_function_assignment
@@ -1,16 +1,20 @@
 import itertools
 import sys
-from functools import wraps
+from functools import lru_cache, wraps
+
+
+_MISSING = object()
 
 
 def instance_memoize(func):
+  memoized_name = f'_{func.__name__}_memoized'
+
   @wraps(func)
   def _wrapper(self):
-    memoized_name = f'_{func.__name__}_memoized'
-    if hasattr(self, memoized_name):
-      return getattr(self, memoized_name)
-    out = func(self)
-    setattr(self, memoized_name, out)
+    out = getattr(self, memoized_name, _MISSING)
+    if out is _MISSING:
+      out = func(self)
+      setattr(self, memoized_name, out)
     return out
 
   return _wrapper
@@ -29,8 +33,13 @@ def assert_expected_iterable(actual, expected):
   assert not difference, difference  # Should be empty set.
 
 
+@lru_cache(maxsize=None)
 def get_possible_builtin_symbols():
-  return itertools.chain(['__builtins__', '__builtin__'], __builtins__.keys(), PYTHON2_EXCLUSIVE_BUILTINS)
+  # Interned so lookups against dicts keyed by these symbols (e.g. Frame builtins) can short-circuit
+  # on identity.
+  return frozenset(
+      sys.intern(symbol) for symbol in itertools.chain(['__builtins__', '__builtin__'], __builtins__.keys(),
+                                                       PYTHON2_EXCLUSIVE_BUILTINS))
 
 
 def print_tree(node, indent='', file=sys.stdout):
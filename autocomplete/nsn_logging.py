@@ -48,6 +48,11 @@ def info(message, *args, log=True, **kwargs):
     _logger.info(_format_message(message), *args, **kwargs)
 
 
+def debug_enabled():
+  '''Whether debug messages will actually be logged - useful for skipping expensive formatting.'''
+  return not _logging_disabled and _logger.isEnabledFor(logging.DEBUG)
+
+
 def debug(message, *args, log=True, **kwargs):
   if log and not _logging_disabled:
     _logger.debug(_format_message(message), *args, **kwargs)